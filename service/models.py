@@ -80,6 +80,13 @@ class Product(db.Model):
         db.Enum(Category), nullable=False, server_default=(Category.UNKNOWN.name)
     )
 
+    # Indexes backing find_by_name, find_by_category and find_by_availability
+    __table_args__ = (
+        db.Index("ix_product_name", "name"),
+        db.Index("ix_product_category", "category"),
+        db.Index("ix_product_available_true", "available", postgresql_where=db.text("available")),
+    )
+
     ##################################################
     # INSTANCE METHODS
     ##################################################